@@ -8,7 +8,7 @@ __author__ = "DevCrewX"
 
 # Import main classes for easier access
 from .assistant import EnhancedVoiceAssistant
-from .spotify_control import SpotifyController
+from .spotify_control import SpotifyController, get_spotify_controller
 from .audio import AudioManager
 from .notifications import NotificationManager
 from .platform_utils import is_windows, is_linux, is_mac, get_spotify_executable_path
@@ -17,6 +17,7 @@ from .utils import load_environment
 __all__ = [
     'EnhancedVoiceAssistant', 
     'SpotifyController', 
+    'get_spotify_controller',
     'AudioManager', 
     'NotificationManager',
     'is_windows', 
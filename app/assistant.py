@@ -1,7 +1,9 @@
 import os
+import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
-from .spotify_control import SpotifyController
+from .spotify_control import get_spotify_controller
 from .audio import AudioManager
 from .notifications import NotificationManager
 from .utils import load_environment
@@ -16,6 +18,38 @@ formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
 handler.setFormatter(formatter)
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 
+
+def _keyword_pattern(*keywords):
+    """Compile keywords into one alternation that only matches whole words."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b')
+
+
+# "play <song>" / "put on <song>" anywhere in a command names a song to search
+# for; whole words only, so "replay" and "display" don't count
+_SONG_REQUEST = re.compile(r'\b(?:play|put on)\s+(.+)')
+
+# Command keyword patterns in priority order, each paired with its handler
+# method; the first pattern found in the command wins
+_COMMAND_TABLE = (
+    (_keyword_pattern('play', 'replay', 'start', 'resume', 'go'), '_do_resume'),
+    (_keyword_pattern('pause', 'stop', 'halt'), '_do_pause'),
+    (_keyword_pattern('next', 'skip', 'forward'), '_do_next'),
+    (_keyword_pattern('previous', 'back', 'last'), '_do_previous'),
+    (_keyword_pattern('volume up', 'louder', 'turn up'), '_do_volume_up'),
+    (_keyword_pattern('volume down', 'quieter', 'turn down'), '_do_volume_down'),
+    (_keyword_pattern('what', 'playing', 'current', 'now'), '_do_current'),
+    (_keyword_pattern('quit', 'exit', 'bye', 'goodbye'), '_do_quit'),
+)
+
+
+class _TextModeExit(BaseException):
+    """Raised by the SIGINT handler to leave text mode.
+
+    A BaseException so ``except Exception`` blocks between the signal and
+    text_mode_loop (command handlers, calibration) cannot swallow it.
+    """
+
+
 class EnhancedVoiceAssistant:
 
     def __init__(self):
@@ -35,13 +69,20 @@ class EnhancedVoiceAssistant:
             notifier=self.notifier,
             wake_word=self.wake_word
         )
-        self.spotify_controller = SpotifyController(
+        self.spotify_controller = get_spotify_controller(
             client_id=os.getenv('SPOTIFY_CLIENT_ID'),
             client_secret=os.getenv('SPOTIFY_CLIENT_SECRET'),
             redirect_uri=os.getenv('SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8080/callback'),
             cache_path=os.path.join(os.path.dirname(__file__), '../cache/.spotify_cache'),
             notifier=self.notifier
         )
+        # Authenticate in the background while audio setup runs
+        self.spotify_controller.warm_up()
+        # Spotify actions run on one ordered worker so the main loop can go
+        # back to listening while the HTTP request is still in flight
+        self._command_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spotify-command')
+        # Help text, built on first use and rebuilt when the wake word changes
+        self._tips = None
         
         # Error handler will be used directly in assistant methods
 
@@ -82,6 +123,7 @@ class EnhancedVoiceAssistant:
         self.is_running = True
         self.is_awake = False
         self.switch_to_text_mode = False  # Flag for switching to text mode
+        self._in_text_mode = False
         
         # Add thread safety for signal handlers
         import threading
@@ -89,6 +131,23 @@ class EnhancedVoiceAssistant:
         
         logging.info("EnhancedVoiceAssistant initialized.")
 
+    def _on_sigterm(self, signum, frame):
+        logging.info(f"Received shutdown signal ({signum}). Shutting down gracefully.")
+        with self._lock:
+            self.is_running = False
+
+    def _on_sigint(self, signum, frame):
+        """Ctrl+C switches voice mode to text mode and stops the assistant from text mode."""
+        with self._lock:
+            if not self._in_text_mode:
+                logging.info("SIGINT received: switching to text mode.")
+                self.switch_to_text_mode = True
+                return
+            logging.info("SIGINT received in text mode: shutting down.")
+            self.is_running = False
+        # Unblock the pending input() call, or whatever text mode is running
+        raise _TextModeExit
+
     def run(self):
         import signal
         self.audio_manager.setup_enhanced_audio()
@@ -99,16 +158,8 @@ class EnhancedVoiceAssistant:
             "normal",
             8000
         )
-        def handle_sigterm(signum, frame):
-            logging.info(f"Received shutdown signal ({signum}). Shutting down gracefully.")
-            with self._lock:
-                self.is_running = False
-        def handle_sigint(signum, frame):
-            logging.info("SIGINT received: switching to text mode.")
-            with self._lock:
-                self.switch_to_text_mode = True
-        signal.signal(signal.SIGTERM, handle_sigterm)
-        signal.signal(signal.SIGINT, handle_sigint)
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+        signal.signal(signal.SIGINT, self._on_sigint)
         try:
             while self.is_running:
                 if self.switch_to_text_mode:
@@ -151,10 +202,14 @@ class EnhancedVoiceAssistant:
     def _cleanup_resources(self):
         """Cleanup resources when shutting down."""
         try:
+            # Let queued Spotify actions finish before the client is torn down
+            self._command_executor.shutdown(wait=True)
             if hasattr(self.audio_manager, 'cleanup'):
                 self.audio_manager.cleanup()
             if hasattr(self.spotify_controller, 'cleanup'):
                 self.spotify_controller.cleanup()
+            if hasattr(self.notifier, 'shutdown'):
+                self.notifier.shutdown()
             logging.info("Resources cleaned up successfully")
         except Exception as e:
             logging.warning(f"Error during cleanup: {e}")
@@ -162,20 +217,22 @@ class EnhancedVoiceAssistant:
     def text_mode_loop(self):
         print("\n📝 TEXT MODE: Type commands or 'voice' to return to voice mode")
         try:
+            self._in_text_mode = True
             while self.is_running:
                 user_input = input("text> ").strip()
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                choice = user_input.lower()
+                if choice in ('quit', 'exit', 'q'):
                     self.notifier.send_notification("👋 Enhanced Assistant Stopping", "Shutting down", "application-exit", "low", 3000)
                     self.is_running = False
                     break
-                elif user_input.lower() == 'voice':
+                elif choice == 'voice':
                     print("🎤 Returning to voice mode...")
                     break
-                elif user_input.lower() == 'help':
+                elif choice == 'help':
                     self.show_enhanced_tips()
-                elif user_input.lower() == 'wake':
+                elif choice == 'wake':
                     self.change_wake_word()
-                elif user_input.lower() == 'recalibrate':
+                elif choice == 'recalibrate':
                     print("🔄 Forcing voice recalibration...")
                     self.audio_manager.enhanced_calibration()
                     print("🎤 Returning to voice mode after calibration...")
@@ -184,8 +241,13 @@ class EnhancedVoiceAssistant:
                     self.process_command(user_input)
                 else:
                     print("💡 Empty input. Type 'help' for commands or 'voice' to switch modes")
-        except KeyboardInterrupt:
+        except _TextModeExit:
+            print("\n👋 Shutting down...")
+        except EOFError:
+            # stdin was closed
             print("\n🎤 Returning to voice mode...")
+        finally:
+            self._in_text_mode = False
 
     def change_wake_word(self):
         print(f"\nCurrent wake word: '{self.wake_word}'")
@@ -194,6 +256,7 @@ class EnhancedVoiceAssistant:
         if new_wake_word:
             self.wake_word = new_wake_word.lower()
             self.audio_manager.wake_word = self.wake_word
+            self._tips = None
             print(f"✅ Wake word changed to: '{self.wake_word}'")
             self.notifier.send_notification(
                 "🔄 Wake Word Changed",
@@ -202,15 +265,9 @@ class EnhancedVoiceAssistant:
                 "normal",
                 5000
             )
-            # Save to calibration file
+            # Save to calibration file from the copy the audio manager already holds
             try:
-                import json
-                if os.path.exists(self.calibration_file):
-                    with open(self.calibration_file, 'r') as f:
-                        data = json.load(f)
-                    data['wake_word'] = self.wake_word
-                    with open(self.calibration_file, 'w') as f:
-                        json.dump(data, f, indent=2)
+                if self.audio_manager.save_wake_word():
                     print(f"✅ Wake word saved to calibration file")
             except Exception as e:
                 print(f"⚠️ Could not save wake word: {e}")
@@ -218,7 +275,14 @@ class EnhancedVoiceAssistant:
             print(f"Keeping current wake word: '{self.wake_word}'")
 
     def show_enhanced_tips(self):
-        tips = [
+        if self._tips is None:
+            self._tips = self._build_tips()
+        print("\n💡 Enhanced Voice Recognition Tips:")
+        for tip in self._tips:
+            print(f"  {tip}")
+
+    def _build_tips(self):
+        return [
             f"😴 WAKE WORD MODE: Say '{self.wake_word}' to wake me up",
             "👂 I sleep between commands to let you enjoy music",
             "🎤 After wake word, speak your FULL command in ONE sentence",
@@ -228,47 +292,70 @@ class EnhancedVoiceAssistant:
             f"🎵 Example: '{self.wake_word}' → 'pause' or 'next track'",
             "📏 Speak at normal pace, don't rush",
             "🎚️ I'll automatically adjust sensitivity",
-            "⌨️ Press Ctrl+C anytime for text mode",
+            "⌨️ Press Ctrl+C for text mode, and again there to quit",
             "🔄 Type 'wake' to change wake word"
         ]
-        print("\n💡 Enhanced Voice Recognition Tips:")
-        for tip in tips:
-            print(f"  {tip}")
+
+    def _submit_spotify_action(self, action, *args):
+        """Queue a Spotify controller call on the command worker and return immediately."""
+        def run_action():
+            try:
+                action(*args)
+            except Exception as e:
+                self.error_handler.handle_error(e, f"Spotify action failed: {action.__name__}")
+        return self._command_executor.submit(run_action)
+
+    def _do_resume(self):
+        self._submit_spotify_action(self.spotify_controller.resume_playback)
+
+    def _do_pause(self):
+        self._submit_spotify_action(self.spotify_controller.pause_playback)
+
+    def _do_next(self):
+        self._submit_spotify_action(self.spotify_controller.next_track)
+
+    def _do_previous(self):
+        self._submit_spotify_action(self.spotify_controller.previous_track)
+
+    def _do_volume_up(self):
+        self._submit_spotify_action(self.spotify_controller.adjust_volume, 15)
+
+    def _do_volume_down(self):
+        self._submit_spotify_action(self.spotify_controller.adjust_volume, -15)
+
+    def _do_current(self):
+        self._submit_spotify_action(self.spotify_controller.get_current_track)
+
+    def _do_quit(self):
+        """Stop the main loop after a spoken or typed quit command."""
+        self.notifier.send_notification(
+            "👋 Enhanced Assistant Stopping",
+            "Enhanced Spotify Voice Assistant is shutting down",
+            "application-exit",
+            "low",
+            3000
+        )
+        self.is_running = False
 
     def process_command(self, command):
         """Process voice commands with comprehensive error handling."""
         try:
-            command = command.lower().strip()
-            if 'play' in command and len(command.split()) > 1:
-                song_name = command.split('play', 1)[1].strip()
+            command = command.strip().lower()
+            if not command:
+                # False wake triggers often transcribe to nothing
+                return
+            song_request = _SONG_REQUEST.search(command)
+            if song_request:
+                song_name = song_request.group(1).strip()
                 song_name = song_name.replace('the song', '').strip()
                 song_name = song_name.replace('song called', '').strip()
                 song_name = song_name.replace('track', '').strip()
                 if song_name:
-                    self.spotify_controller.play_song(song_name)
+                    self._submit_spotify_action(self.spotify_controller.play_song, song_name)
                     return
-            if any(word in command for word in ['play', 'start', 'resume', 'go']):
-                self.spotify_controller.resume_playback()
-            elif any(word in command for word in ['pause', 'stop', 'halt']):
-                self.spotify_controller.pause_playback()
-            elif any(word in command for word in ['next', 'skip', 'forward']):
-                self.spotify_controller.next_track()
-            elif any(word in command for word in ['previous', 'back', 'last']):
-                self.spotify_controller.previous_track()
-            elif 'volume up' in command or 'louder' in command or 'turn up' in command:
-                self.spotify_controller.adjust_volume(15)
-            elif 'volume down' in command or 'quieter' in command or 'turn down' in command:
-                self.spotify_controller.adjust_volume(-15)
-            elif any(word in command for word in ['what', 'playing', 'current', 'now']):
-                self.spotify_controller.get_current_track()
-            elif any(word in command for word in ['quit', 'exit', 'bye', 'goodbye']):
-                self.notifier.send_notification(
-                    "👋 Enhanced Assistant Stopping",
-                    "Enhanced Spotify Voice Assistant is shutting down",
-                    "application-exit",
-                    "low",
-                    3000
-                )
-                self.is_running = False
+            for pattern, method in _COMMAND_TABLE:
+                if pattern.search(command):
+                    getattr(self, method)()
+                    break
         except Exception as e:
             self.error_handler.handle_error(e, f"Failed to process command: {command}")
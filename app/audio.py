@@ -2,6 +2,15 @@ import speech_recognition as sr
 import pyttsx3
 import logging
 import os
+import re
+import json
+import math
+import time
+import atexit
+import socket
+import threading
+from collections import deque
+from contextlib import contextmanager
 from typing import Optional
 
 # Import error handling types
@@ -10,6 +19,85 @@ try:
 except ImportError:
     ErrorHandler = None
 
+# Optional fast JSON for the calibration file; both helpers work on bytes
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+
+# Optional NumPy acceleration for audio energy computations
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional JIT compilation of the per-window energy loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional polyphase resampler; audioop.ratecv via speech_recognition without it
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
+# Optional WebRTC voice activity detection for wake word endpointing
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Optional offline speech recognition (Vosk); Google Web Speech is used without it
+try:
+    from vosk import Model, KaldiRecognizer, SetLogLevel
+except ImportError:
+    Model = KaldiRecognizer = SetLogLevel = None
+
+RECOGNITION_SAMPLE_RATE = 16000  # Vosk model rate; also enough for Google
+WAKE_CHUNK_FRAMES = 2000  # 4000 bytes of 16-bit mono audio per read
+WAKE_PHRASE_LIMIT = 1.5  # seconds; the wake word itself is well under this
+WAKE_TRAILING_SILENCE = 0.3  # seconds of silence that end a wake word utterance
+VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)  # rates webrtcvad accepts
+AMBIENT_UPDATE_INTERVAL = 30  # seconds between background energy threshold updates
+AMBIENT_MIN_THRESHOLD = 100
+DEFAULT_VOSK_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models', 'vosk-model-small-en-us')
+GOOGLE_SPEECH_HOST = 'www.google.com'  # host recognize_google posts audio to
+
+def _window_rms_numpy(samples, win, hop):
+    """RMS of each ``win``-sample window of int16 ``samples``, advancing ``hop`` samples."""
+    frames = np.lib.stride_tricks.sliding_window_view(samples, win)[::hop].astype(np.float64)
+    return np.sqrt((frames * frames).mean(axis=-1))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _window_rms(samples, win, hop):
+        """RMS of each ``win``-sample window of int16 ``samples``, advancing ``hop`` samples."""
+        count = (samples.shape[0] - win) // hop + 1 if samples.shape[0] >= win else 0
+        out = np.empty(count, dtype=np.float64)
+        for i in range(count):
+            start = i * hop
+            acc = 0.0
+            for j in range(start, start + win):
+                value = np.float64(samples[j])
+                acc += value * value
+            out[i] = np.sqrt(acc / win)
+        return out
+else:
+    _window_rms = _window_rms_numpy
+
+
 class AudioManager:
     def __init__(self, calibration_file, notifier=None, wake_word='jarvis'):
         self.recognizer = sr.Recognizer()
@@ -28,11 +116,35 @@ class AudioManager:
         import threading
         self._microphone_lock = threading.Lock()
         self._shared_microphone = None
+        # Microphone entered once and kept open for the session, see _microphone_stream
+        self._source_lock = threading.Lock()
+        self._mic_source = None
+        atexit.register(self._close_microphone_stream)
+        # Last calibration data read from or written to calibration_file
+        self._calib = None
+        # PortAudio device names, enumerated once on first use
+        self._mic_names = None
+        # Local recognizer, loaded once in setup_enhanced_audio and reused
+        self.vosk_model = None
+        self.vosk_rec = None
+        # Grammar-restricted wake word recognizer, rebuilt when the wake word changes
+        self._wake_rec = None
+        self._wake_rec_key = None
+        # Voice activity detector for ending wake word utterances early
+        self._vad = webrtcvad.Vad(2) if webrtcvad is not None else None
+        # Rolling RMS of audio read while waiting for speech; the ambient
+        # monitor turns it into self.recognizer.energy_threshold
+        self._ambient_rms = deque(maxlen=2048)
+        self._ambient_lock = threading.Lock()
+        self._ambient_stop = threading.Event()
+        self._ambient_thread = None
         logging.info("AudioManager initialized.")
 
     def cleanup(self):
         """Clean up audio resources."""
         try:
+            self._ambient_stop.set()
+            self._close_microphone_stream()
             with self._microphone_lock:
                 self._shared_microphone = None
             if hasattr(self.tts, 'stop'):
@@ -46,6 +158,7 @@ class AudioManager:
         try:
             # Find best microphone
             self.select_best_microphone()
+            self._warm_speech_api()
             # ENHANCED settings specifically for longer phrases
             self.recognizer.energy_threshold = 200
             self.recognizer.dynamic_energy_threshold = True
@@ -55,7 +168,12 @@ class AudioManager:
             self.recognizer.phrase_threshold = 0.2
             self.recognizer.non_speaking_duration = 0.5
             self.recognizer.operation_timeout = None
+            self._setup_local_recognizer()
+            if njit is not None and np is not None:
+                # Compile (or load from cache) before the first listen
+                _window_rms(np.frombuffer(bytes(2), dtype=np.int16), 1, 1)
             self.smart_calibration()
+            self._start_ambient_monitor()
             logging.info("Audio setup for long phrases complete.")
         except Exception as e:
             logging.exception(f"Audio setup failed in setup_enhanced_audio (calibration_file={self.calibration_file}, wake_word={self.wake_word}):")
@@ -67,11 +185,97 @@ class AudioManager:
                 )
             raise
 
+    def _warm_speech_api(self):
+        """Resolve the Google speech host in the background so the first command skips the DNS lookup."""
+        def resolve():
+            try:
+                socket.getaddrinfo(GOOGLE_SPEECH_HOST, 80, proto=socket.IPPROTO_TCP)
+            except OSError as e:
+                logging.debug(f"Speech API warm-up lookup failed: {e}")
+        threading.Thread(target=resolve, name='speech-api-warmup', daemon=True).start()
+
+    def _setup_local_recognizer(self):
+        """Load the Vosk model once so recognition can run offline."""
+        if Model is None:
+            logging.info("vosk not installed, using Google speech recognition only")
+            return
+        model_path = os.getenv('VOSK_MODEL_PATH', DEFAULT_VOSK_MODEL_PATH)
+        if not os.path.isdir(model_path):
+            logging.info(f"Vosk model not found at {model_path}, using Google speech recognition only")
+            return
+        try:
+            SetLogLevel(-1)
+            self.vosk_model = Model(model_path)
+            self.vosk_rec = KaldiRecognizer(self.vosk_model, RECOGNITION_SAMPLE_RATE)
+            logging.info(f"Local speech recognition enabled (vosk model: {model_path})")
+        except Exception as e:
+            logging.warning(f"Failed to load Vosk model from {model_path}: {e}")
+            self.vosk_model = None
+            self.vosk_rec = None
+
+    def _recognize_local(self, audio):
+        """Transcribe audio with the persistent Vosk recognizer; '' if unavailable."""
+        if self.vosk_rec is None:
+            return ''
+        try:
+            self.vosk_rec.Reset()
+            # A no-op conversion for audio that went through _resample_for_recognition
+            self.vosk_rec.AcceptWaveform(audio.get_raw_data(convert_rate=RECOGNITION_SAMPLE_RATE, convert_width=2))
+            return json.loads(self.vosk_rec.FinalResult()).get('text', '').lower()
+        except Exception as e:
+            logging.warning(f"Local speech recognition failed: {e}")
+            return ''
+
+    @property
+    def wake_word(self):
+        return self._wake_word
+
+    @wake_word.setter
+    def wake_word(self, value):
+        # '|' separates aliases ("jarvis|computer"); all of them are matched
+        # as whole words by one precompiled pattern
+        self._wake_word = value
+        self._wake_aliases = [w.strip() for w in value.lower().split('|') if w.strip()] or [value.lower()]
+        self._wake_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, self._wake_aliases)) + r')\b')
+
+    def _get_wake_recognizer(self, sample_rate):
+        """Return a Vosk recognizer whose grammar only knows the wake word aliases."""
+        key = (self.wake_word.lower(), sample_rate)
+        if self._wake_rec is None or self._wake_rec_key != key:
+            grammar = json.dumps(self._wake_aliases + ["[unk]"])
+            self._wake_rec = KaldiRecognizer(self.vosk_model, sample_rate, grammar)
+            self._wake_rec_key = key
+        return self._wake_rec
+
+    def _start_ambient_monitor(self):
+        """Track ambient noise off the hot path instead of before every utterance."""
+        if np is None or self._ambient_thread is not None:
+            return
+        self._ambient_thread = threading.Thread(target=self._ambient_monitor, name='ambient-monitor', daemon=True)
+        self._ambient_thread.start()
+
+    def _ambient_monitor(self):
+        """Periodically derive the energy threshold from the rolling ambient RMS."""
+        while not self._ambient_stop.wait(AMBIENT_UPDATE_INTERVAL):
+            with self._ambient_lock:
+                if len(self._ambient_rms) < 50:
+                    continue
+                rms_buf = np.array(self._ambient_rms)
+            # Samples are non-speech only (see _record_ambient), so a low
+            # percentile tracks the noise floor rather than music or talk
+            threshold = max(AMBIENT_MIN_THRESHOLD, float(np.percentile(rms_buf, 10)) * 1.5)
+            self.recognizer.energy_threshold = threshold
+            logging.debug(f"Ambient monitor set energy threshold to {threshold:.0f}")
+
+    def _record_ambient(self, rms):
+        """Add the RMS of a chunk judged non-speech (below threshold or by VAD)."""
+        with self._ambient_lock:
+            self._ambient_rms.append(rms)
+
     def select_best_microphone(self):
         """Get shared microphone instance to prevent device locking."""
         with self._microphone_lock:
             if self._shared_microphone is None:
-                mic_list = sr.Microphone.list_microphone_names()
                 sample_rate = 44100  # Match typical output device sample rate
                 try:
                     self._shared_microphone = sr.Microphone(sample_rate=sample_rate)
@@ -80,6 +284,54 @@ class AudioManager:
                     self._shared_microphone = sr.Microphone()  # Use default
             return self._shared_microphone
 
+    @contextmanager
+    def _microphone_stream(self):
+        """Yield the microphone source, keeping its PortAudio stream open between listens.
+
+        The stream is opened on first use instead of once per listen. Audio that
+        queued up since the last read is discarded on entry, and a failed read
+        (an OSError from PortAudio) closes the stream so the next listen reopens
+        it; recognizer and network errors raised in the block leave it open.
+        """
+        with self._source_lock:
+            if self._mic_source is None:
+                self._mic_source = self.select_best_microphone().__enter__()
+            source = self._mic_source
+        self._discard_buffered_audio(source)
+        try:
+            yield source
+        except (socket.timeout, ConnectionError):
+            raise
+        except OSError:
+            self._close_microphone_stream()
+            raise
+
+    @staticmethod
+    def _discard_buffered_audio(source):
+        """Drop frames that queued up in the open stream while nobody was listening."""
+        try:
+            available = source.stream.pyaudio_stream.get_read_available()
+            if available:
+                source.stream.read(available)
+        except Exception as e:
+            logging.debug(f"Could not flush microphone buffer: {e}")
+
+    def _close_microphone_stream(self):
+        """Close the session microphone stream if it is open."""
+        with self._source_lock:
+            source, self._mic_source = self._mic_source, None
+        if source is not None:
+            try:
+                source.__exit__(None, None, None)
+            except Exception as e:
+                logging.debug(f"Error closing microphone stream: {e}")
+
+    def _microphone_names(self):
+        """Return the microphone device names, enumerating PortAudio devices only once."""
+        if self._mic_names is None:
+            self._mic_names = sr.Microphone.list_microphone_names()
+        return self._mic_names
+
     def _validate_calibration_path(self):
         """Validate and secure the calibration file path."""
         try:
@@ -102,7 +354,6 @@ class AudioManager:
             raise
 
     def load_calibration_data(self):
-        import json
         from datetime import datetime, timedelta
         try:
             validated_path = self._validate_calibration_path()
@@ -114,21 +365,23 @@ class AudioManager:
                     logging.warning("Calibration file has unsafe permissions, fixing...")
                     os.chmod(validated_path, 0o600)
                 
-                with open(validated_path, 'r') as f:
-                    data = json.load(f)
+                with open(validated_path, 'rb') as f:
+                    data = _loads(f.read())
                 
                 # Validate data structure
                 required_fields = ['date', 'energy_threshold', 'pause_threshold']
                 if not all(field in data for field in required_fields):
                     logging.warning("Calibration file missing required fields")
                     return None
+                # Kept even when stale so wake word changes can be saved without a reread
+                self._calib = data
                 
                 calibration_date = datetime.fromisoformat(data.get('date', '2000-01-01'))
                 if datetime.now() - calibration_date < timedelta(days=7):
                     if 'wake_word' in data and isinstance(data['wake_word'], str):
                         # Sanitize wake word input
                         wake_word = data['wake_word'].strip()[:50]  # Limit length
-                        if wake_word.isalnum():
+                        if all(alias.isalnum() for alias in wake_word.split('|')):
                             self.wake_word = wake_word
                     return data
             return None
@@ -137,8 +390,6 @@ class AudioManager:
             return None
 
     def save_calibration_data(self, energy_threshold, pause_threshold, success_rate=1.0):
-        import json
-        import tempfile
         from datetime import datetime
         try:
             validated_path = self._validate_calibration_path()
@@ -156,66 +407,104 @@ class AudioManager:
                 'energy_threshold': float(energy_threshold),
                 'pause_threshold': float(pause_threshold),
                 'success_rate': float(success_rate),
-                'microphone_count': len(sr.Microphone.list_microphone_names()),
+                'microphone_count': len(self._microphone_names()),
                 'wake_word': str(self.wake_word)[:50],  # Sanitize and limit
                 'version': '1.0'
             }
             
-            # Atomic write using temporary file
+            self._write_calibration(validated_path, data)
+            self._calib = data
+            logging.info("Calibration data saved successfully")
+            return True
+        except Exception as e:
+            logging.warning(f"Failed to save calibration data: {e}", exc_info=True)
+            return False
+
+    @staticmethod
+    def _write_calibration(validated_path, data):
+        """Atomically replace the calibration file with ``data``, readable by the owner only."""
+        import tempfile
+        tmp_file_path = None
+        try:
             with tempfile.NamedTemporaryFile(
-                mode='w', 
+                mode='wb', 
                 dir=os.path.dirname(validated_path),
                 delete=False,
                 prefix='.tmp_calibration_',
                 suffix='.json'
             ) as tmp_file:
-                json.dump(data, tmp_file, indent=2)
                 tmp_file_path = tmp_file.name
+                tmp_file.write(_dumps(data))
             
             # Set secure permissions before moving
             os.chmod(tmp_file_path, 0o600)
             
             # Atomically replace the file
             os.replace(tmp_file_path, validated_path)
-            
-            logging.info("Calibration data saved successfully")
-            return True
-        except Exception as e:
-            logging.warning(f"Failed to save calibration data: {e}", exc_info=True)
+        except BaseException:
             # Clean up temp file if it exists
-            if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
+            if tmp_file_path and os.path.exists(tmp_file_path):
                 try:
                     os.unlink(tmp_file_path)
-                except:
+                except OSError:
                     pass
+            raise
+
+    def save_wake_word(self):
+        """Write the current wake word into the calibration file from the in-memory copy.
+
+        Returns False when no calibration has been loaded or saved yet; the
+        wake word is then stored by the next calibration.
+        """
+        if self._calib is None:
             return False
+        data = dict(self._calib, wake_word=str(self.wake_word)[:50])
+        self._write_calibration(self._validate_calibration_path(), data)
+        self._calib = data
+        return True
 
     def smart_calibration(self):
         saved_data = self.load_calibration_data()
         import speech_recognition as sr
         recognizer = sr.Recognizer()
-        mic = self.select_best_microphone()
         if saved_data:
             recognizer.energy_threshold = saved_data['energy_threshold']
             recognizer.pause_threshold = saved_data['pause_threshold']
             try:
-                with mic as source:
-                    recognizer.adjust_for_ambient_noise(source, duration=2)
+                with self._microphone_stream() as source:
+                    self._calibrate_ambient(recognizer, source, duration=2)
             except Exception as e:
                 logging.warning(f"Ambient adjustment failed: {e}", exc_info=True)
+            self.recognizer.energy_threshold = recognizer.energy_threshold
         else:
             self.enhanced_calibration()
 
+    def _calibrate_ambient(self, recognizer, source, duration):
+        """Set ``recognizer.energy_threshold`` from ``duration`` seconds of ambient audio.
+
+        With NumPy the whole recording is windowed (100 ms windows, 50 ms hop)
+        and every window's RMS is computed in one pass (Numba-compiled when
+        available, vectorized NumPy otherwise); the
+        threshold is the 95th percentile times 1.5.
+        """
+        if np is None:
+            recognizer.adjust_for_ambient_noise(source, duration=duration)
+            return
+        raw = source.stream.read(int(duration * source.SAMPLE_RATE))
+        samples = np.frombuffer(raw, dtype=np.int16)
+        window = source.SAMPLE_RATE // 10
+        rms = _window_rms(samples, window, window // 2)
+        recognizer.energy_threshold = float(np.percentile(rms, 95)) * 1.5
+
     def enhanced_calibration(self):
         import speech_recognition as sr
         recognizer = sr.Recognizer()
-        mic = self.select_best_microphone()
         try:
-            with mic as source:
-                recognizer.adjust_for_ambient_noise(source, duration=4)
+            with self._microphone_stream() as source:
+                self._calibrate_ambient(recognizer, source, duration=4)
             initial_threshold = recognizer.energy_threshold
             try:
-                with mic as source:
+                with self._microphone_stream() as source:
                     audio = recognizer.listen(source, timeout=8, phrase_time_limit=15)
                     test_result = recognizer.recognize_google(audio, language='en-US')
                 if len(test_result.split()) >= 3:
@@ -225,6 +514,7 @@ class AudioManager:
             except Exception:
                 recognizer.energy_threshold = 250
                 recognizer.pause_threshold = 3.5
+            self.recognizer.energy_threshold = recognizer.energy_threshold
             self.save_calibration_data(
                 recognizer.energy_threshold,
                 recognizer.pause_threshold,
@@ -265,33 +555,41 @@ class AudioManager:
         def audio_resources():
             """Context manager for proper audio resource cleanup."""
             recognizer = None
-            mic = None
             try:
                 recognizer = sr.Recognizer()
-                mic = self.select_best_microphone()
-                yield recognizer, mic
+                yield recognizer
             finally:
                 # Proper cleanup without manual del
                 if recognizer:
                     recognizer = None
-                if mic:
-                    mic = None
         
         try:
-            with audio_resources() as (recognizer, mic):
-                # Apply rate limiting for Google Speech API
-                self._apply_google_api_rate_limit()
-                
-                with mic as source:
-                    recognizer.adjust_for_ambient_noise(source, duration=0.2)
-                    audio = recognizer.listen(
-                        source,
-                        timeout=timeout,
-                        phrase_time_limit=7
-                    )
+            with audio_resources() as recognizer:
+                # Ambient noise is tracked in the background, not per utterance
+                recognizer.energy_threshold = self.recognizer.energy_threshold
+                with self._microphone_stream() as source:
+                    if np is not None:
+                        audio = self._capture_phrase(
+                            source,
+                            energy_threshold=recognizer.energy_threshold,
+                            pause_threshold=recognizer.pause_threshold,
+                            timeout=timeout,
+                            phrase_time_limit=7
+                        )
+                    else:
+                        audio = recognizer.listen(
+                            source,
+                            timeout=timeout,
+                            phrase_time_limit=7
+                        )
                 
-                # Try multiple recognition approaches with proper error handling
-                command = self._try_speech_recognition(recognizer, audio)
+                audio = self._resample_for_recognition(audio)
+                # Try the local recognizer first, then fall back to Google
+                command = self._recognize_local(audio)
+                if not command:
+                    # Apply rate limiting for Google Speech API
+                    self._apply_google_api_rate_limit()
+                    command = self._try_speech_recognition(recognizer, audio)
                 if command:
                     self.success_count += 1
                     return command
@@ -305,6 +603,70 @@ class AudioManager:
             logging.exception(f"Error in listen_for_command: {e}")
             return None
 
+    @staticmethod
+    def _chunk_rms(buffer):
+        """RMS energy of a chunk of 16-bit PCM, same scale as audioop.rms."""
+        samples = np.frombuffer(buffer, dtype=np.int16)
+        return float(_window_rms(samples, samples.size, samples.size)[0]) if samples.size else 0.0
+
+    def _capture_phrase(self, source, energy_threshold, pause_threshold, timeout, phrase_time_limit):
+        """Record one phrase with a NumPy energy endpointer.
+
+        Equivalent to ``Recognizer.listen`` for 16-bit audio: waits up to
+        ``timeout`` seconds for energy above ``energy_threshold``, then records
+        until ``pause_threshold`` seconds of silence or ``phrase_time_limit``.
+        A short pre-roll keeps the onset of the first word.
+        """
+        chunk_seconds = source.CHUNK / source.SAMPLE_RATE
+        pause_chunks = max(1, math.ceil(pause_threshold / chunk_seconds))
+        limit_chunks = math.ceil(phrase_time_limit / chunk_seconds)
+        pre_roll = deque(maxlen=max(1, math.ceil(0.3 / chunk_seconds)))
+        
+        elapsed = 0.0
+        while True:
+            buffer = source.stream.read(source.CHUNK)
+            elapsed += chunk_seconds
+            rms = self._chunk_rms(buffer)
+            if rms > energy_threshold:
+                break
+            self._record_ambient(rms)
+            pre_roll.append(buffer)
+            if timeout and elapsed > timeout:
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+        
+        frames = list(pre_roll)
+        frames.append(buffer)
+        silent_chunks = 0
+        for _ in range(limit_chunks):
+            buffer = source.stream.read(source.CHUNK)
+            frames.append(buffer)
+            if self._chunk_rms(buffer) > energy_threshold:
+                silent_chunks = 0
+            else:
+                silent_chunks += 1
+                if silent_chunks >= pause_chunks:
+                    break
+        
+        return sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+
+    @staticmethod
+    def _resample_for_recognition(audio):
+        """Convert captured audio to 16-bit 16 kHz mono once, before any recognizer sees it.
+
+        The microphone is opened at 44.1 kHz; downsampling here means Vosk needs
+        no conversion and Google receives a third of the samples.
+        """
+        if audio.sample_rate == RECOGNITION_SAMPLE_RATE and audio.sample_width == 2:
+            return audio
+        if resample_poly is not None and np is not None and audio.sample_width == 2:
+            samples = np.frombuffer(audio.get_raw_data(), dtype=np.int16)
+            divisor = math.gcd(RECOGNITION_SAMPLE_RATE, audio.sample_rate)
+            resampled = resample_poly(samples, RECOGNITION_SAMPLE_RATE // divisor, audio.sample_rate // divisor)
+            raw = np.clip(np.rint(resampled), -32768, 32767).astype(np.int16).tobytes()
+        else:
+            raw = audio.get_raw_data(convert_rate=RECOGNITION_SAMPLE_RATE, convert_width=2)
+        return sr.AudioData(raw, RECOGNITION_SAMPLE_RATE, 2)
+
     def _apply_google_api_rate_limit(self):
         """Apply rate limiting for Google Speech API (45 calls per minute)."""
         import time
@@ -313,62 +675,46 @@ class AudioManager:
             self._last_api_call = 0
             self._api_call_interval = 60.0 / 45  # 45 calls per minute
         
-        now = time.time()
+        now = time.monotonic()
         time_since_last = now - self._last_api_call
         if time_since_last < self._api_call_interval:
             time.sleep(self._api_call_interval - time_since_last)
-        self._last_api_call = time.time()
+        self._last_api_call = time.monotonic()
 
     def _try_speech_recognition(self, recognizer, audio):
-        """Try speech recognition with multiple fallback options."""
+        """Recognize audio with a single Google request and return its top transcript."""
         import speech_recognition as sr
         
-        # Try primary language (US English)
-        try:
-            return recognizer.recognize_google(audio, language='en-US').lower()
-        except (sr.UnknownValueError, sr.RequestError):
-            pass
-        
-        # Try fallback language (UK English)
-        try:
-            return recognizer.recognize_google(audio, language='en-GB').lower()
-        except (sr.UnknownValueError, sr.RequestError):
-            pass
-        
-        # Try with confidence analysis
         try:
             results = recognizer.recognize_google(audio, language='en-US', show_all=True)
-            if results and 'alternative' in results:
-                alternatives = results['alternative']
-                if alternatives:
-                    command = alternatives[0]['transcript'].lower()
-                    confidence = alternatives[0].get('confidence', 0)
-                    if confidence > 0.3:
-                        return command
         except (sr.UnknownValueError, sr.RequestError):
-            pass
+            return None
         
-        return None
+        # show_all returns an empty list when nothing was recognized
+        alternatives = results.get('alternative', []) if isinstance(results, dict) else []
+        if not alternatives:
+            return None
+        # Google usually scores only the first alternative, so there is
+        # nothing to rank; keep the top transcript as recognize_google would
+        top = alternatives[0]
+        confidence = top.get('confidence')
+        if confidence is not None and confidence < 0.3:
+            logging.debug(f"Low-confidence transcript ({confidence:.2f}): {top['transcript']}")
+        return top['transcript'].lower()
 
     def listen_for_wake_word(self):
+        if self.vosk_model is not None:
+            return self._listen_for_wake_word_streaming()
         import speech_recognition as sr
         try:
             recognizer = sr.Recognizer()
-            mic = self.select_best_microphone()
-            with mic as source:
-                recognizer.adjust_for_ambient_noise(source, duration=0.2)
-                audio = recognizer.listen(
-                    source,
-                    timeout=30,
-                    phrase_time_limit=5
-                )
+            recognizer.energy_threshold = self.recognizer.energy_threshold
+            with self._microphone_stream() as source:
+                audio = self._capture_wake_phrase(recognizer, source, timeout=30)
             try:
                 recognized_text = recognizer.recognize_google(audio, language='en-US').lower()
                 # No manual deletion needed - Python's garbage collector will handle cleanup
-                if self.wake_word.lower() in recognized_text:
-                    return True
-                else:
-                    return False
+                return self._wake_re.search(recognized_text) is not None
             except sr.UnknownValueError:
                 return False
             except sr.RequestError:
@@ -379,6 +725,92 @@ class AudioManager:
             logging.exception(f"Wake word listening error in listen_for_wake_word (wake_word={self.wake_word}):")
             return False
 
+    def _capture_wake_phrase(self, recognizer, source, timeout):
+        """Record a short utterance for the wake word check.
+
+        Recording ends WAKE_TRAILING_SILENCE after speech stops, or after
+        WAKE_PHRASE_LIMIT at most, so a wake word isn't followed by seconds of
+        tail audio. Uses WebRTC VAD when the stream rate allows it, then the
+        NumPy energy endpointer, then Recognizer.listen.
+        """
+        if self._vad is not None and source.SAMPLE_RATE in VAD_SAMPLE_RATES and source.SAMPLE_WIDTH == 2:
+            return self._capture_with_vad(source, timeout)
+        if np is not None:
+            return self._capture_phrase(
+                source,
+                energy_threshold=recognizer.energy_threshold,
+                pause_threshold=WAKE_TRAILING_SILENCE,
+                timeout=timeout,
+                phrase_time_limit=WAKE_PHRASE_LIMIT
+            )
+        recognizer.pause_threshold = WAKE_TRAILING_SILENCE
+        recognizer.non_speaking_duration = WAKE_TRAILING_SILENCE
+        return recognizer.listen(source, timeout=timeout, phrase_time_limit=WAKE_PHRASE_LIMIT)
+
+    def _capture_with_vad(self, source, timeout):
+        """Record one short utterance by running WebRTC VAD over 20 ms frames."""
+        frame_frames = source.SAMPLE_RATE // 50
+        silence_limit = round(WAKE_TRAILING_SILENCE / 0.02)
+        frame_limit = round(WAKE_PHRASE_LIMIT / 0.02)
+        pre_roll = deque(maxlen=5)
+        
+        waited = 0.0
+        while True:
+            frame = source.stream.read(frame_frames)
+            if self._vad.is_speech(frame, source.SAMPLE_RATE):
+                break
+            if np is not None:
+                self._record_ambient(self._chunk_rms(frame))
+            pre_roll.append(frame)
+            waited += 0.02
+            if waited > timeout:
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+        
+        frames = list(pre_roll)
+        frames.append(frame)
+        silent_frames = 0
+        for _ in range(frame_limit):
+            frame = source.stream.read(frame_frames)
+            frames.append(frame)
+            if self._vad.is_speech(frame, source.SAMPLE_RATE):
+                silent_frames = 0
+            else:
+                silent_frames += 1
+                if silent_frames >= silence_limit:
+                    break
+        
+        return sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+
+    def _listen_for_wake_word_streaming(self, timeout=30):
+        """Stream microphone chunks into the wake word grammar recognizer.
+
+        Returns True as soon as a partial result contains the wake word, or
+        False after ``timeout`` seconds without a match.
+        """
+        try:
+            with self._microphone_stream() as source:
+                wake_rec = self._get_wake_recognizer(source.SAMPLE_RATE)
+                wake_rec.Reset()
+                wake_re = self._wake_re
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    chunk = source.stream.read(WAKE_CHUNK_FRAMES)
+                    if np is not None:
+                        rms = self._chunk_rms(chunk)
+                        if rms <= self.recognizer.energy_threshold:
+                            self._record_ambient(rms)
+                    if wake_rec.AcceptWaveform(chunk):
+                        text = json.loads(wake_rec.Result()).get('text', '')
+                    else:
+                        text = json.loads(wake_rec.PartialResult()).get('partial', '')
+                    if wake_re.search(text):
+                        wake_rec.Reset()
+                        return True
+            return False
+        except Exception as e:
+            logging.exception(f"Wake word streaming error in _listen_for_wake_word_streaming (wake_word={self.wake_word}):")
+            return False
+
     def adjust_sensitivity(self):
         if self.attempt_count > 2:
             success_rate = self.success_count / self.attempt_count
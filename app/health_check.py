@@ -56,7 +56,13 @@ class HealthCheck:
         optional_packages = [
             'cryptography',  # For secure token storage
             'win10toast',    # Windows notifications
-            'plyer'          # Cross-platform notifications
+            'plyer',         # Cross-platform notifications
+            'orjson',        # Faster token cache serialization
+            'vosk',          # Offline speech recognition
+            'numpy',         # Vectorized audio energy computations
+            'scipy',         # Polyphase resampling to 16 kHz
+            'webrtcvad',     # Voice activity detection for wake word endpointing
+            'numba'          # JIT-compiled audio energy loop
         ]
         
         all_good = True
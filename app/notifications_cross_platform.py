@@ -1,12 +1,40 @@
 import logging
+import queue
+import shutil
+import threading
+import time
 from .platform_utils import is_windows, is_linux, is_mac
 
 class CrossPlatformNotificationManager:
+    # Notifications arriving this close together are batched, and only the
+    # latest one per key (the title unless given) is shown
+    COALESCE_WINDOW = 0.05
+    # An identical repeat of the last shown notification inside this window is dropped
+    DEDUP_WINDOW = 0.5
+    # When the queue is full, a pending notification older than this is discarded
+    STALE_AFTER = 0.5
+
     def __init__(self):
         self.notifications_enabled = False
         self.notification_backend = None
         self.setup_notifications()
 
+        # Notifications are dispatched by a single background worker so callers
+        # on the voice command path never block on notify-send/DBus/toast I/O.
+        self._notif_q = queue.Queue(maxsize=64)
+        self._last_sent = None
+        self._last_sent_at = 0.0
+        # notify-send ids of the last notification per key (the title unless
+        # given), reused with --replace-id so e.g. track changes update one
+        # bubble in place without unrelated notifications replacing each other
+        self._replace_ids = {}
+        # Running notify-send processes per key whose printed id is not read yet
+        self._id_procs = {}
+        # Whether notify-send supports --print-id/--replace-id; None until probed
+        self._notify_send_ids = None
+        self._notif_thread = threading.Thread(target=self._notify_worker, daemon=True)
+        self._notif_thread.start()
+
     def setup_notifications(self):
         """Setup platform-specific notification system."""
         try:
@@ -46,10 +74,8 @@ class CrossPlatformNotificationManager:
 
     def _setup_linux_notifications(self):
         """Setup Linux notify-send notifications."""
-        import subprocess
         try:
-            result = subprocess.run(['which', 'notify-send'], capture_output=True, text=True)
-            if result.returncode == 0:
+            if shutil.which('notify-send'):
                 self.notification_backend = 'notify-send'
                 self.notifications_enabled = True
                 logging.info("Linux desktop notifications enabled (notify-send)")
@@ -79,17 +105,81 @@ class CrossPlatformNotificationManager:
             logging.info("macOS notifications enabled (plyer)")
         except ImportError:
             # Fallback to osascript
-            import subprocess
-            try:
-                subprocess.run(['which', 'osascript'], capture_output=True, check=True)
+            if shutil.which('osascript'):
                 self.notification_backend = 'osascript'
                 self.notifications_enabled = True
                 logging.info("macOS notifications enabled (osascript)")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 logging.warning("No notification system available on macOS")
                 self.notifications_enabled = False
 
-    def send_notification(self, title, message, icon="audio-headphones", urgency="normal", timeout=5000):
+    def send_notification(self, title, message, icon="audio-headphones", urgency="normal", timeout=5000, key=None):
+        """Queue a notification for the background worker and return immediately.
+
+        Notifications sharing ``key`` (default: the title) that arrive in one
+        burst are coalesced so only the latest is shown.
+        """
+        item = (time.monotonic(), key or title, title, message, icon, urgency, timeout)
+        try:
+            self._notif_q.put_nowait(item)
+        except queue.Full:
+            # Never block the caller: replace the oldest pending notification
+            # if it is already stale, otherwise drop this one. Done under the
+            # queue's own mutex so nothing is reordered or lost in between.
+            with self._notif_q.mutex:
+                pending = self._notif_q.queue
+                if pending and pending[0] is not None and item[0] - pending[0][0] > self.STALE_AFTER:
+                    pending.popleft()
+                    pending.append(item)
+                    return
+            logging.debug(f"Notification queue full, dropping: {title}")
+
+    def shutdown(self, timeout=1.0):
+        """Flush pending notifications and stop the worker thread."""
+        try:
+            self._notif_q.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._notif_thread.join(timeout)
+
+    def _notify_worker(self):
+        """Drain the notification queue, coalescing bursts to the latest notification per key."""
+        running = True
+        while running:
+            item = self._notif_q.get()
+            if item is None:
+                break
+            pending = {item[1]: item}
+            # Give a burst a moment to arrive, then take everything queued
+            time.sleep(self.COALESCE_WINDOW)
+            while True:
+                try:
+                    item = self._notif_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                # Last write wins; re-insert so dispatch order follows the latest update
+                pending.pop(item[1], None)
+                pending[item[1]] = item
+            for item in pending.values():
+                self._dispatch_coalesced(item)
+
+    def _dispatch_coalesced(self, item):
+        """Show one coalesced notification unless it repeats the last one verbatim."""
+        content = item[1:]
+        now = time.monotonic()
+        if content == self._last_sent and now - self._last_sent_at < self.DEDUP_WINDOW:
+            return
+        self._last_sent = content
+        self._last_sent_at = now
+        try:
+            self._dispatch_notification(*item[2:], key=item[1])
+        except Exception as e:
+            logging.warning(f"Notification dispatch failed: {e}")
+
+    def _dispatch_notification(self, title, message, icon, urgency, timeout, key=None):
         """Send cross-platform notification with fallback support."""
         if not self.notifications_enabled:
             # Final fallback to console output
@@ -105,7 +195,7 @@ class CrossPlatformNotificationManager:
         
         for backend in backends_to_try:
             try:
-                if self._try_send_with_backend(backend, title, message, icon, urgency, timeout):
+                if self._try_send_with_backend(backend, title, message, icon, urgency, timeout, key):
                     return
             except Exception as e:
                 logging.warning(f"Notification backend {backend} failed: {e}")
@@ -113,14 +203,14 @@ class CrossPlatformNotificationManager:
         # Final fallback to console
         print(f"NOTIFICATION: {title} - {message}")
 
-    def _try_send_with_backend(self, backend, title, message, icon, urgency, timeout):
+    def _try_send_with_backend(self, backend, title, message, icon, urgency, timeout, key=None):
         """Try to send notification with specific backend."""
         if backend == 'win10toast':
             self._send_windows_toast(title, message, timeout)
         elif backend == 'plyer':
             self._send_plyer_notification(title, message, timeout)
         elif backend == 'notify-send':
-            self._send_linux_notification(title, message, icon, urgency, timeout)
+            self._send_linux_notification(title, message, icon, urgency, timeout, key or title)
         elif backend == 'osascript':
             self._send_mac_notification(title, message)
         else:
@@ -153,8 +243,8 @@ class CrossPlatformNotificationManager:
         except Exception as e:
             logging.warning(f"Plyer notification failed: {e}")
 
-    def _send_linux_notification(self, title, message, icon, urgency, timeout):
-        """Send Linux notification using notify-send."""
+    def _send_linux_notification(self, title, message, icon, urgency, timeout, key):
+        """Send Linux notification using notify-send, replacing the last one sent under ``key``."""
         import subprocess
         try:
             cmd = [
@@ -163,14 +253,55 @@ class CrossPlatformNotificationManager:
                 f'--icon={icon}',
                 f'--urgency={urgency}',
                 f'--expire-time={timeout}',
-                '--category=music',
-                title,
-                message
+                '--category=music'
             ]
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if self._notify_send_ids is None:
+                # Probe once, waiting for the result: libnotify older than
+                # 0.7.9 rejects --print-id and shows nothing
+                result = subprocess.run(
+                    cmd + ['--print-id', title, message],
+                    capture_output=True, text=True, timeout=5
+                )
+                self._notify_send_ids = result.returncode == 0
+                if self._notify_send_ids:
+                    if result.stdout.strip().isdigit():
+                        self._replace_ids[key] = result.stdout.strip()
+                    return
+                logging.info("notify-send does not support replacing notifications, disabling")
+            elif self._notify_send_ids:
+                # Don't wait for notify-send: its id is collected on the next
+                # notification with this key
+                replace_id = self._collect_notification_id(key)
+                replace = [f'--replace-id={replace_id}'] if replace_id else []
+                self._id_procs[key] = subprocess.Popen(
+                    cmd + ['--print-id'] + replace + [title, message],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+                )
+                return
+            subprocess.Popen(cmd + [title, message], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             logging.warning(f"Linux notification failed: {e}")
 
+    def _collect_notification_id(self, key):
+        """Return the id of the last notification shown under ``key``, if known.
+
+        A notify-send for ``key`` that is still running is waited for briefly,
+        so it is always reaped and its pipe closed before the next one starts.
+        """
+        import subprocess
+        proc = self._id_procs.pop(key, None)
+        if proc is not None:
+            try:
+                notification_id, _ = proc.communicate(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                notification_id = ''
+            notification_id = notification_id.strip()
+            if proc.returncode == 0 and notification_id.isdigit():
+                self._replace_ids[key] = notification_id
+        return self._replace_ids.get(key)
+
     def _send_mac_notification(self, title, message):
         """Send macOS notification using osascript with proper input validation."""
         import subprocess
@@ -1,20 +1,69 @@
+import requests
 import spotipy
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
+import hashlib
 import logging
 import os
 import stat
 import json
+import tempfile
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from functools import wraps
 from typing import Optional
 from .launch_spotify import launch_spotify
 
+logger = logging.getLogger(__name__)
+
 # Import error handling types
 try:
     from .error_handling import ErrorHandler
 except ImportError:
     ErrorHandler = None
 
+# Optional fast JSON for token (de)serialization; both helpers work on bytes
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data.decode('utf-8'))
+
+# Optional encryption support for the token cache
+try:
+    from cryptography.fernet import Fernet
+except ImportError:
+    Fernet = None
+
+# OAuth scopes needed for playback control
+_SPOTIFY_SCOPE = "user-modify-playback-state,user-read-playback-state,user-read-currently-playing"
+
+# Search result cache: hits expire after _SEARCH_TTL seconds, misses after
+# _SEARCH_MISS_TTL, at most _SEARCH_MAX entries kept
+_SEARCH_TTL = 120
+_SEARCH_MISS_TTL = 60
+_SEARCH_MAX = 128
+
+# An empty player state (no active device) is reused for this many seconds,
+# longer than a normal playback snapshot since it rarely changes quickly
+_PLAYBACK_MISS_TTL = 5.0
+
+# Fernet instances shared per key file across SecureTokenStorage instances
+_FERNET_CACHE = {}
+
+
+def clear_fernet_cache():
+    """Forget all memoized Fernet instances (mainly useful for tests)."""
+    _FERNET_CACHE.clear()
+
 
 class AuthenticationError(Exception):
     """Raised when Spotify authentication fails."""
@@ -26,6 +75,11 @@ class ConnectionError(Exception):
     pass
 
 
+class FixtureMissError(Exception):
+    """Raised in replay mode when a call has no recorded response."""
+    pass
+
+
 class SecureTokenStorage:
     """Encrypted token storage for Spotify OAuth tokens."""
     
@@ -34,100 +88,262 @@ class SecureTokenStorage:
         os.makedirs(cache_dir, mode=0o700, exist_ok=True)  # Owner-only permissions
         self.key_file = os.path.join(cache_dir, '.key')
         self.token_file = os.path.join(cache_dir, '.spotify_tokens.enc')
+        # Decrypted token kept in memory, valid while the file mtime is unchanged
+        self._cached_token = None
+        self._cached_mtime = None
         self._setup_encryption()
     
     def _setup_encryption(self):
         """Set up encryption using cryptography.fernet."""
-        try:
-            from cryptography.fernet import Fernet
-            
-            if os.path.exists(self.key_file):
+        if Fernet is None:
+            logger.warning("cryptography not available, falling back to basic protection")
+            self.cipher = None
+            return
+        
+        cipher = _FERNET_CACHE.get(self.key_file)
+        if cipher is None:
+            try:
                 with open(self.key_file, 'rb') as f:
                     key = f.read()
-            else:
+            except FileNotFoundError:
                 key = Fernet.generate_key()
-                with open(self.key_file, 'wb') as f:
-                    f.write(key)
-                os.chmod(self.key_file, 0o600)  # Owner read/write only
+                self._atomic_write(self.key_file, key)
             
-            self.cipher = Fernet(key)
-        except ImportError:
-            logging.warning("cryptography not available, falling back to basic protection")
-            self.cipher = None
+            cipher = Fernet(key)
+            _FERNET_CACHE[self.key_file] = cipher
+        
+        self.cipher = cipher
+    
+    def _atomic_write(self, path, data):
+        """Write bytes to ``path`` via a temp file so readers never see partial content."""
+        # mkstemp creates the file owner read/write only (0o600)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tok')
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def get_cached_token(self):
         """Retrieve and decrypt cached token (spotipy interface)."""
-        if not os.path.exists(self.token_file):
-            return None
-        
         try:
+            try:
+                mtime = os.stat(self.token_file).st_mtime
+            except FileNotFoundError:
+                return None
+            if self._cached_token is not None and mtime == self._cached_mtime:
+                return self._cached_token
+            
             with open(self.token_file, 'rb') as f:
                 encrypted_data = f.read()
             
             if self.cipher:
-                decrypted_data = self.cipher.decrypt(encrypted_data)
-                return json.loads(decrypted_data.decode('utf-8'))
+                token_info = _loads(self.cipher.decrypt(encrypted_data))
             else:
                 # Fallback for when cryptography is not available
-                return json.loads(encrypted_data.decode('utf-8'))
+                token_info = _loads(encrypted_data)
+            
+            self._cached_token = token_info
+            self._cached_mtime = mtime
+            return token_info
                 
         except Exception as e:
-            logging.warning(f"Failed to read cached token: {e}")
+            logger.warning("Failed to read cached token: %s", e)
             return None
     
     def save_token_to_cache(self, token_info):
         """Encrypt and save token to cache (spotipy interface)."""
         try:
-            token_data = json.dumps(token_info).encode('utf-8')
-            
             if self.cipher:
-                encrypted_data = self.cipher.encrypt(token_data)
+                buf = self.cipher.encrypt(_dumps(token_info))
             else:
                 # Fallback for when cryptography is not available
-                encrypted_data = token_data
-                logging.warning("Saving token without encryption - install cryptography package for security")
+                buf = _dumps(token_info)
+                logger.warning("Saving token without encryption - install cryptography package for security")
+            
+            self._atomic_write(self.token_file, buf)
             
-            with open(self.token_file, 'wb') as f:
-                f.write(encrypted_data)
-            os.chmod(self.token_file, 0o600)  # Owner read/write only
+            self._cached_token = token_info
+            self._cached_mtime = os.stat(self.token_file).st_mtime
             
         except Exception as e:
-            logging.error(f"Failed to save token: {e}")
+            logger.error("Failed to save token: %s", e)
+
+
+class CachedTokenSpotifyOAuth(SpotifyOAuth):
+    """SpotifyOAuth that serves the access token from memory until shortly before expiry.
+
+    spotipy asks the auth manager for a token on every request; this skips the
+    cache-handler lookup and expiry validation while the token is still fresh.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._token_cache = {"token": None, "exp": 0}
+    
+    def get_access_token(self, code=None, as_dict=True, check_cache=True):
+        use_memory = code is None and not as_dict and check_cache
+        if use_memory and self._token_cache["token"] and time.time() < self._token_cache["exp"] - 60:
+            return self._token_cache["token"]
+        
+        token = super().get_access_token(code=code, as_dict=as_dict, check_cache=check_cache)
+        if use_memory:
+            token_info = self.cache_handler.get_cached_token()
+            if token_info and token_info.get('access_token') == token:
+                self._token_cache = {"token": token, "exp": token_info.get('expires_at', 0)}
+        return token
+    
+    def refresh_access_token(self, refresh_token):
+        self._token_cache = {"token": None, "exp": 0}
+        return super().refresh_access_token(refresh_token)
 
 
 class SpotifyRateLimiter:
-    """Rate limiter for Spotify API calls."""
+    """Token-bucket rate limiter shared by every Spotify API call of a controller."""
     
-    def __init__(self, calls_per_second=8):  # Conservative limit
-        self.calls_per_second = calls_per_second
-        self.last_call_time = 0
-        self.min_interval = 1.0 / calls_per_second
+    def __init__(self, calls_per_second=8, burst=None):  # Conservative limit
+        self.rate = calls_per_second
+        self.capacity = burst or calls_per_second
+        self.tokens = float(self.capacity)
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it.
+
+        The refill check and update happen under the lock so concurrent
+        callers cannot both spend the same token; the API call itself is
+        made by the caller outside the lock.
+        """
+        with self.lock:
+            now = time.monotonic()
+            elapsed = max(0.0, now - self.last_update)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_update = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.last_update = time.monotonic()
+            self.tokens -= 1
+    
+    def penalize(self, seconds):
+        """Drain the bucket so no call is issued for ``seconds`` (Retry-After)."""
+        with self.lock:
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+    
+    def call(self, func, *args, **kwargs):
+        """Call ``func`` once a token is available, retrying once on HTTP 429."""
+        self.acquire()
+        try:
+            return func(*args, **kwargs)
+        except spotipy.SpotifyException as e:
+            if e.http_status == 429:  # Rate limited
+                retry_after = int((e.headers or {}).get('Retry-After', 60))
+                logger.warning("Spotify rate limit hit, waiting %s seconds", retry_after)
+                self.penalize(retry_after)
+                self.acquire()
+                return func(*args, **kwargs)
+            raise
     
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time.time()
-            time_since_last = now - self.last_call_time
-            
-            if time_since_last < self.min_interval:
-                time.sleep(self.min_interval - time_since_last)
-                
-            self.last_call_time = time.time()
+            return self.call(func, *args, **kwargs)
+        return wrapper
+
+class SpotifyFixtureClient:
+    """Stand-in for ``spotipy.Spotify`` that replays recorded API responses.
+
+    Responses are keyed by a SHA-256 of the method name and its arguments.
+    Given a real ``client``, calls are forwarded and their responses recorded
+    to ``fixture_path`` instead; a SpotifyException is recorded under
+    ``error:<key>`` and raised again on replay. Enabled with SPOTIFY_REPLAY / SPOTIFY_RECORD
+    so command handling can be exercised without network access or API quota.
+    """
+    
+    def __init__(self, fixture_path, client=None):
+        self.fixture_path = fixture_path
+        self.client = client
+        self._lock = threading.Lock()
+        try:
+            with open(fixture_path, 'rb') as f:
+                self.fixtures = _loads(f.read())
+        except FileNotFoundError:
+            if client is None:
+                raise
+            self.fixtures = {}
+    
+    @staticmethod
+    def _key(name, args, kwargs):
+        blob = json.dumps([name, args, kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+    
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        
+        def call(*args, **kwargs):
+            key = self._key(name, args, kwargs)
+            if self.client is None:
+                if key in self.fixtures:
+                    return self.fixtures[key]
+                error = self.fixtures.get(f"error:{key}")
+                if error is not None:
+                    raise spotipy.SpotifyException(**error)
+                raise FixtureMissError(f"No recorded Spotify response for {name}(args={args}, kwargs={kwargs})")
             try:
-                return func(*args, **kwargs)
+                response = getattr(self.client, name)(*args, **kwargs)
             except spotipy.SpotifyException as e:
-                if e.http_status == 429:  # Rate limited
-                    retry_after = int(e.headers.get('Retry-After', 60))
-                    logging.warning(f"Spotify rate limit hit, waiting {retry_after} seconds")
-                    time.sleep(retry_after)
-                    return func(*args, **kwargs)
+                self._record(f"error:{key}", {
+                    'http_status': e.http_status,
+                    'code': e.code,
+                    'msg': e.msg,
+                    'reason': e.reason,
+                    'headers': dict(e.headers or {}),
+                })
                 raise
-        return wrapper
+            self._record(key, response)
+            return response
+        call.__name__ = name
+        return call
+    
+    def _record(self, key, value):
+        with self._lock:
+            self.fixtures[key] = value
+            self._save()
+    
+    def _save(self):
+        """Rewrite the fixture file atomically."""
+        directory = os.path.dirname(os.path.abspath(self.fixture_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.fixture')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(self.fixtures))
+            os.replace(tmp_path, self.fixture_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
 
 class SpotifyController:
+    # Icon/urgency/timeout arguments shared by the notifications below
+    _ICON_TRACK = ("audio-x-generic", "normal", 6000)
+    _ICON_PLAYING = ("audio-volume-high", "normal", 6000)
+    _ICON_ERR = ("dialog-error",)
+
     def __init__(self, client_id, client_secret, redirect_uri, cache_path, notifier=None):
-        scope = "user-modify-playback-state,user-read-playback-state,user-read-currently-playing"
-        
         # Initialize components
         self.notifier = notifier
         self.error_handler = None  # Will be assigned by VoiceAssistant
@@ -137,78 +353,202 @@ class SpotifyController:
         self.secure_token_storage = SecureTokenStorage(cache_dir)
         
         # Create custom SpotifyOAuth that uses our secure storage
-        self.spotify_oauth = SpotifyOAuth(
+        self.spotify_oauth = CachedTokenSpotifyOAuth(
             client_id=client_id,
             client_secret=client_secret,
             redirect_uri=redirect_uri,
-            scope=scope,
+            scope=_SPOTIFY_SCOPE,
             cache_handler=self.secure_token_storage
         )
         
-        # Rate limiter for API calls
-        self.rate_limiter = SpotifyRateLimiter(calls_per_second=8)
+        # Rate limiter shared by all API calls made through _spotify_call()
+        # ~180 requests/minute sustained, with room for a short burst of
+        # back-to-back commands ("next, next, next")
+        self.rate_limiter = SpotifyRateLimiter(calls_per_second=3, burst=6)
+        
+        # LRU of normalized song name -> (fetched_at, best matching track)
+        self._search_cache = OrderedDict()
+        
+        # (fetched_at, response) of the last current_playback() call
+        self._playback_cache = (0.0, None)
+        # (fetched_at, response) of the last devices() call
+        self._devices_cache = (0.0, None)
+        
+        # The spotipy client is created lazily (see the ``spotify`` property)
+        # so OAuth and credential verification stay off the startup path.
+        self._spotify = None
+        # Fixture file to replay API responses from instead of calling Spotify
+        self._replay_path = os.getenv('SPOTIFY_REPLAY')
+        self._spotify_lock = threading.Lock()
+        self._session = self._build_session()
+        # Opt-in keep-alive pings for the pooled connection, see _ping_api
+        self._keepalive = os.getenv('SPOTIFY_KEEPALIVE', '').lower() in ('1', 'true', 'yes')
+        self._last_api_call = 0.0
         
-        self.spotify = spotipy.Spotify(auth_manager=self.spotify_oauth)
+        # Refresh the access token ahead of expiry instead of on the first 401
+        self._refresh_lock = threading.Lock()
+        self._stop_refresh = threading.Event()
+        self._refresh_thread = threading.Thread(target=self._token_refresh_loop, daemon=True)
+        if not self._replay_path:
+            # Replays must not touch the network, not even for OAuth
+            self._refresh_thread.start()
+
+    @property
+    def spotify(self):
+        """Authenticated spotipy client, connected on first access."""
+        if self._spotify is None:
+            with self._spotify_lock:
+                if self._spotify is None:
+                    self._spotify = self._connect()
+        return self._spotify
+
+    @staticmethod
+    def _build_session():
+        """Create a keep-alive HTTP session reused for every API call."""
+        session = requests.Session()
+        # 429 is left to SpotifyRateLimiter so Retry-After throttles all callers
+        retry = Retry(
+            total=3,
+            status=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        )
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        return session
+
+    def _connect(self):
+        """Create the spotipy client and verify the credentials."""
+        if self._replay_path:
+            logger.info("Replaying Spotify responses from %s", self._replay_path)
+            return SpotifyFixtureClient(self._replay_path)
+        client = spotipy.Spotify(auth_manager=self.spotify_oauth, requests_session=self._session)
         
         # Verify credentials with error handling
         try:
-            user_info = self.spotify.current_user()
-            logging.info(f"Spotify connected successfully for user: {user_info.get('display_name', 'Unknown')}")
+            user_info = client.current_user()
+            logger.info("Spotify connected successfully for user: %s", user_info.get('display_name', 'Unknown'))
         except spotipy.SpotifyException as e:
             error_msg = f"Spotify authentication failed: {e}"
-            logging.error(error_msg)
-            if notifier:
-                notifier.send_notification("🚫 Spotify Auth Error", error_msg, "dialog-error", "critical", 0)
+            logger.error(error_msg)
+            if self.notifier:
+                self.notifier.send_notification("🚫 Spotify Auth Error", error_msg, "dialog-error", "critical", 0)
             raise AuthenticationError(error_msg) from e
         except Exception as e:
             error_msg = f"Unexpected error during Spotify connection: {e}"
-            logging.error(error_msg)
-            if notifier:
-                notifier.send_notification("💥 Spotify Connection Error", error_msg, "dialog-error", "critical", 0)
+            logger.error(error_msg)
+            if self.notifier:
+                self.notifier.send_notification("💥 Spotify Connection Error", error_msg, "dialog-error", "critical", 0)
             raise ConnectionError(error_msg) from e
-        
-        self.notifier = notifier
+        record_path = os.getenv('SPOTIFY_RECORD')
+        if record_path:
+            logger.info("Recording Spotify responses to %s", record_path)
+            return SpotifyFixtureClient(record_path, client)
+        return client
+
+    def warm_up(self):
+        """Connect to Spotify in a background thread so the first command rarely waits."""
+        def connect():
+            try:
+                self.spotify
+            except Exception:
+                pass  # Already logged and notified; retried on first command
+        thread = threading.Thread(target=connect, daemon=True)
+        thread.start()
+        return thread
+
+    def _token_refresh_loop(self, interval=300, keepalive=60):
+        """Periodically refresh the token and keep the API connection warm until cleanup()."""
+        last_refresh = time.monotonic()
+        while not self._stop_refresh.wait(keepalive):
+            self._ping_api()
+            if time.monotonic() - last_refresh >= interval:
+                last_refresh = time.monotonic()
+                self._refresh_token_if_expiring()
+
+    def _ping_api(self, idle_after=60):
+        """Send a cheap HEAD so the pooled TLS connection isn't dropped between wake words.
+
+        Only with SPOTIFY_KEEPALIVE set, and only once no API call has used
+        the connection for ``idle_after`` seconds.
+        """
+        if not self._keepalive or self._spotify is None or self._replay_path:
+            return
+        if time.monotonic() - self._last_api_call < idle_after:
+            return
+        try:
+            # Unauthenticated, so it costs neither a token refresh nor rate-limit budget
+            self._session.head('https://api.spotify.com/v1/', timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Spotify keep-alive ping failed: %s", e)
+
+    def _refresh_token_if_expiring(self, margin=600):
+        """Refresh the cached access token if it expires within ``margin`` seconds."""
+        with self._refresh_lock:
+            token_info = self.secure_token_storage.get_cached_token()
+            if not token_info or 'refresh_token' not in token_info:
+                return
+            # expires_at is a wall-clock epoch timestamp set by spotipy
+            if token_info.get('expires_at', 0) - time.time() >= margin:
+                return
+            try:
+                self.spotify_oauth.refresh_access_token(token_info['refresh_token'])
+                logger.info("Spotify access token refreshed proactively")
+            except Exception as e:
+                logger.warning("Proactive token refresh failed: %s", e)
+
+    def _spotify_call(self, func, *args, **kwargs):
+        """Invoke a spotipy client method through the shared rate limiter."""
+        self._last_api_call = time.monotonic()
+        if self._replay_path:
+            return func(*args, **kwargs)
+        return self.rate_limiter.call(func, *args, **kwargs)
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def play_song(self, song_name):
         try:
-            results = self.spotify.search(q=song_name, type='track', limit=3)
-            if results['tracks']['items']:
-                track = results['tracks']['items'][0]
+            tracks = self._search_tracks(song_name)
+            if tracks:
+                track = tracks[0]
+                uri = track['uri']
                 try:
-                    self.spotify.start_playback(uris=[track['uri']])
+                    self._spotify_call(self.spotify.start_playback, uris=[uri])
+                    self._invalidate_playback_cache()
                 except spotipy.SpotifyException as e:
                     if 'No active device' in str(e):
                         device_id = self._handle_no_active_device("song playback")
                         if device_id:
                             try:
-                                self.spotify.start_playback(uris=[track['uri']], device_id=device_id)
+                                self._spotify_call(self.spotify.start_playback, uris=[uri], device_id=device_id)
+                                self._invalidate_playback_cache()
                             except Exception as e2:
                                 if self.notifier:
                                     self.notifier.send_notification(
                                         "❌ Playback Error",
                                         f"Failed to play after launching and transferring: {song_name}",
-                                        "dialog-error"
+                                        *self._ICON_ERR
                                     )
                                 return
                         else:
                             return
                     else:
+                        # Cached URI may be stale, force a fresh search next time
+                        self._search_cache.pop(song_name.strip().lower(), None)
                         if self.notifier:
                             self.notifier.send_notification(
                                 "❌ Playback Error",
                                 f"Failed to play: {song_name}",
-                                "dialog-error"
+                                *self._ICON_ERR
                             )
                         return
                 if self.notifier:
-                    self.notifier.send_notification(
-                        "🎵 Now Playing (Enhanced)",
-                        f"🎤 Search: '{song_name}'\n🎵 Found: {track['name']}\n👨‍🎤 Artist: {track['artists'][0]['name']}",
-                        "audio-volume-high",
-                        "normal",
-                        6000
-                    )
+                    name = track['name']
+                    artist = track['artists'][0]['name']
+                    message = f"🎤 Search: '{song_name}'\n🎵 Found: {name}\n👨‍🎤 Artist: {artist}"
+                    if len(tracks) > 1:
+                        alternatives = ', '.join(f"{t['name']} by {t['artists'][0]['name']}" for t in tracks[1:3])
+                        message += f"\n🔀 Also found: {alternatives}"
+                    self.notifier.send_notification("🎵 Now Playing (Enhanced)", message, *self._ICON_PLAYING)
             else:
                 if self.notifier:
                     self.notifier.send_notification(
@@ -223,26 +563,46 @@ class SpotifyController:
                 self.notifier.send_notification(
                     "❌ Playback Error",
                     f"Failed to play: {song_name}",
-                    "dialog-error"
+                    *self._ICON_ERR
                 )
 
-    @SpotifyRateLimiter(calls_per_second=6)
+    def _search_tracks(self, query):
+        """Return the top track matches for ``query`` (empty if none), using a short-lived LRU cache."""
+        key = query.strip().lower()
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            self._search_cache.move_to_end(key)
+            return cached[1]
+        
+        results = self._spotify_call(self.spotify.search, q=query, type='track', limit=3)
+        items = results['tracks']['items']
+        # Misses are remembered briefly so a repeated misrecognition doesn't
+        # hammer /search, but expire soon enough for a retry to find the song
+        ttl = _SEARCH_TTL if items else _SEARCH_MISS_TTL
+        self._search_cache[key] = (time.monotonic() + ttl, items)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > _SEARCH_MAX:
+            self._search_cache.popitem(last=False)
+        return items
+
     def resume_playback(self):
         try:
             try:
-                self.spotify.start_playback()
+                self._spotify_call(self.spotify.start_playback)
+                self._invalidate_playback_cache()
             except spotipy.SpotifyException as e:
                 if 'No active device' in str(e):
                     device_id = self._handle_no_active_device("resume playback")
                     if device_id:
                         try:
-                            self.spotify.start_playback(device_id=device_id)
+                            self._spotify_call(self.spotify.start_playback, device_id=device_id)
+                            self._invalidate_playback_cache()
                         except Exception as e2:
                             if self.notifier:
                                 self.notifier.send_notification(
                                     "❌ Playback Error",
                                     "Failed to resume after launching and transferring.",
-                                    "dialog-error"
+                                    *self._ICON_ERR
                                 )
                             return
                     else:
@@ -252,7 +612,7 @@ class SpotifyController:
                         self.notifier.send_notification(
                             "❌ Playback Error",
                             "Failed to resume playback.",
-                            "dialog-error"
+                            *self._ICON_ERR
                         )
                     return
             if self.notifier:
@@ -267,10 +627,10 @@ class SpotifyController:
             if self.notifier:
                 self.notifier.send_notification("❌ No Active Device", "Please start Spotify first", "dialog-warning")
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def pause_playback(self):
         try:
-            self.spotify.pause_playback()
+            self._spotify_call(self.spotify.pause_playback)
+            self._invalidate_playback_cache()
             if self.notifier:
                 self.notifier.send_notification(
                     "⏸️ Playback Paused",
@@ -281,108 +641,94 @@ class SpotifyController:
                 )
         except Exception:
             if self.notifier:
-                self.notifier.send_notification("❌ Pause Failed", "Couldn't pause", "dialog-error")
+                self.notifier.send_notification("❌ Pause Failed", "Couldn't pause", *self._ICON_ERR)
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def next_track(self):
         try:
-            self.spotify.next_track()
+            self._spotify_call(self.spotify.next_track)
+            self._invalidate_playback_cache()
             # After skipping, fetch and notify the new track info
-            current = self.spotify.current_playback()
-            if current and current['is_playing']:
-                track = current['item']
-                name = track['name']
-                artist = track['artists'][0]['name']
-                album = track['album']['name']
-                if self.notifier:
-                    self.notifier.send_notification(
-                        "⏭️ Next Track",
-                        f"{name}\nby {artist}\nAlbum: {album}",
-                        "audio-x-generic",
-                        "normal",
-                        6000
-                    )
+            if self.notifier is None:
+                return
+            info = self._describe_current_track()
+            if info:
+                self.notifier.send_notification(
+                    "⏭️ Next Track",
+                    f"{info['name']}\nby {info['artist']}\nAlbum: {info['album']}",
+                    *self._ICON_TRACK
+                )
         except Exception as e:
+            if self.notifier is None:
+                return
             msg = str(e)
-            if self.notifier:
-                if 'Restriction violated' in msg:
-                    self.notifier.send_notification(
-                        "❌ Skip Failed",
-                        "Spotify cannot skip track on this device. Try using the official Spotify app.",
-                        "dialog-error"
-                    )
-                else:
-                    self.notifier.send_notification("❌ Skip Failed", msg, "dialog-error")
+            if 'Restriction violated' in msg:
+                self.notifier.send_notification(
+                    "❌ Skip Failed",
+                    "Spotify cannot skip track on this device. Try using the official Spotify app.",
+                    *self._ICON_ERR
+                )
+            else:
+                self.notifier.send_notification("❌ Skip Failed", msg, *self._ICON_ERR)
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def previous_track(self):
         try:
-            self.spotify.previous_track()
+            self._spotify_call(self.spotify.previous_track)
+            self._invalidate_playback_cache()
             # After going to previous, fetch and notify the new track info
-            current = self.spotify.current_playback()
-            if current and current['is_playing']:
-                track = current['item']
-                name = track['name']
-                artist = track['artists'][0]['name']
-                album = track['album']['name']
-                if self.notifier:
-                    self.notifier.send_notification(
-                        "⏮️ Previous Track",
-                        f"{name}\nby {artist}\nAlbum: {album}",
-                        "audio-x-generic",
-                        "normal",
-                        6000
-                    )
+            if self.notifier is None:
+                return
+            info = self._describe_current_track()
+            if info:
+                self.notifier.send_notification(
+                    "⏮️ Previous Track",
+                    f"{info['name']}\nby {info['artist']}\nAlbum: {info['album']}",
+                    *self._ICON_TRACK
+                )
         except Exception as e:
+            if self.notifier is None:
+                return
             msg = str(e)
-            if self.notifier:
-                if 'Restriction violated' in msg:
-                    self.notifier.send_notification(
-                        "❌ Previous Failed",
-                        "Spotify cannot go to previous track on this device. Try using the official Spotify app.",
-                        "dialog-error"
-                    )
-                else:
-                    self.notifier.send_notification("❌ Previous Failed", msg, "dialog-error")
+            if 'Restriction violated' in msg:
+                self.notifier.send_notification(
+                    "❌ Previous Failed",
+                    "Spotify cannot go to previous track on this device. Try using the official Spotify app.",
+                    *self._ICON_ERR
+                )
+            else:
+                self.notifier.send_notification("❌ Previous Failed", msg, *self._ICON_ERR)
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def adjust_volume(self, change):
         try:
-            current = self.spotify.current_playback()
+            current = self._get_playback()
             if current and current['device']:
                 volume = max(0, min(100, current['device']['volume_percent'] + change))
-                self.spotify.volume(volume)
+                self._spotify_call(self.spotify.volume, volume)
+                self._invalidate_playback_cache()
         except Exception as e:
+            if self.notifier is None:
+                return
             msg = str(e)
-            if self.notifier:
-                if 'Cannot control device volume' in msg:
-                    self.notifier.send_notification(
-                        "❌ Volume Error",
-                        "Cannot control volume on this device. Try using the official Spotify app.",
-                        "dialog-error"
-                    )
-                else:
-                    self.notifier.send_notification("❌ Volume Error", msg, "dialog-error")
+            if 'Cannot control device volume' in msg:
+                self.notifier.send_notification(
+                    "❌ Volume Error",
+                    "Cannot control volume on this device. Try using the official Spotify app.",
+                    *self._ICON_ERR
+                )
+            else:
+                self.notifier.send_notification("❌ Volume Error", msg, *self._ICON_ERR)
 
-    @SpotifyRateLimiter(calls_per_second=6)
     def get_current_track(self):
         try:
-            current = self.spotify.current_playback()
-            if current and current['is_playing']:
-                track = current['item']
-                name = track['name']
-                artist = track['artists'][0]['name']
-                album = track['album']['name']
+            info = self._describe_current_track()
+            if info:
                 if self.notifier:
                     self.notifier.send_notification(
                         "🎵 Now Playing",
-                        f"{name}\nby {artist}\nAlbum: {album}",
-                        "audio-x-generic",
-                        "normal",
-                        6000
+                        f"{info['name']}\nby {info['artist']}\nAlbum: {info['album']}",
+                        *self._ICON_TRACK
                     )
                 else:
-                    print(f"Now playing: {name} by {artist} (Album: {album})")
+                    print(f"Now playing: {info['name']} by {info['artist']} (Album: {info['album']})")
             else:
                 if self.notifier:
                     self.notifier.send_notification(
@@ -396,41 +742,140 @@ class SpotifyController:
                     print("No track is currently playing.")
         except Exception:
             if self.notifier:
-                self.notifier.send_notification("❌ Info Error", "Couldn't get info", "dialog-error")
+                self.notifier.send_notification("❌ Info Error", "Couldn't get info", *self._ICON_ERR)
             else:
                 print("Couldn't get current track info.")
 
-    def _find_active_device(self):
-        """Find an active Spotify device or suitable computer device."""
-        devices = self.spotify.devices()
-        for device in devices.get('devices', []):
-            if device.get('is_active') or device.get('type') == 'Computer':
-                return device['id']
-        return None
+    def _fetch_current_playback(self):
+        """Fetch the player state with a trimmed response payload.
+
+        Passing a market makes Spotify omit the per-track ``available_markets``
+        list (often several KB), and restricting ``additional_types`` to tracks
+        skips episode objects we never read.
+        """
+        return self._spotify_call(self.spotify.current_playback, market='from_token', additional_types='track')
+
+    def _get_playback(self, max_age=1.5):
+        """Return the player state, reusing a response younger than ``max_age`` seconds; 0 forces a fetch.
+
+        A None response is reused for _PLAYBACK_MISS_TTL instead; calls that
+        change playback invalidate the cache either way.
+        """
+        fetched_at, playback = self._playback_cache
+        if playback is None and max_age:
+            max_age = max(max_age, _PLAYBACK_MISS_TTL)
+        if time.monotonic() - fetched_at < max_age:
+            return playback
+        playback = self._fetch_current_playback()
+        self._playback_cache = (time.monotonic(), playback)
+        return playback
+
+    def _describe_current_track(self):
+        """Return name/artist/album of the playing track, or None if nothing is playing."""
+        current = self._get_playback()
+        if not (current and current['is_playing'] and current['item']):
+            return None
+        track = current['item']
+        return {
+            'name': track['name'],
+            'artist': track['artists'][0]['name'],
+            'album': track['album']['name'],
+        }
+
+    def _invalidate_playback_cache(self):
+        """Drop the cached player state after a call that changes it."""
+        self._playback_cache = (0.0, None)
+
+    def _devices_cached(self, ttl=2.0):
+        """Return devices(), reusing a non-empty response younger than ``ttl`` seconds.
+
+        Empty device lists are never reused so discovery after launching
+        Spotify still sees the new device as soon as it registers.
+        """
+        fetched_at, devices = self._devices_cache
+        if devices and devices.get('devices') and time.monotonic() - fetched_at < ttl:
+            return devices
+        devices = self._spotify_call(self.spotify.devices) or {}
+        self._devices_cache = (time.monotonic(), devices)
+        return devices
+
+    @staticmethod
+    def _device_score(device):
+        """Rank devices: active beats inactive, computers beat other types."""
+        return ((2 if device.get('is_active') else 0)
+                + (1 if device.get('type') == 'Computer' else 0)
+                - (1 if device.get('is_restricted') else 0))
+
+    def _find_active_device(self, ttl=2.0):
+        """Find the best active Spotify device or suitable computer device.
+
+        ``ttl`` is passed to _devices_cached; 0 always asks Spotify.
+        """
+        devices = self._devices_cached(ttl).get('devices', [])
+        candidates = [d for d in devices if d.get('is_active') or d.get('type') == 'Computer']
+        return max(candidates, key=self._device_score) if candidates else None
     
+    def _poll_for_device(self, launch_failed):
+        """Poll devices() with exponential backoff, overlapping slow probes.
+
+        A new probe is issued every backoff interval even if the previous one
+        is still waiting on the network (at most two in flight), and the device
+        dict from the first successful probe is returned. Gives up after ~3
+        seconds or as soon as ``launch_failed()`` reports the launcher failed.
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        probes = set()
+        device = None
+        delay = 0.1
+        try:
+            for _ in range(6):
+                # Uncached: a list holding only other devices must not hide
+                # the client that is still registering
+                probes.add(executor.submit(self._find_active_device, 0))
+                deadline = time.monotonic() + delay
+                while probes and not device:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    done, probes = wait(probes, timeout=remaining, return_when=FIRST_COMPLETED)
+                    device = next((f.result() for f in done if f.exception() is None and f.result()), None)
+                if device or launch_failed():
+                    break
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                delay = min(delay * 2, 0.8)
+        finally:
+            for probe in probes:
+                probe.cancel()
+            executor.shutdown(wait=False)
+        return device
+
     def _launch_and_setup_device(self):
         """Launch Spotify and set up device for playback."""
-        if not launch_spotify():
+        # Launch in the background and start polling right away, so a device
+        # that registers quickly is picked up without waiting on the launcher.
+        launched = []
+        launcher = threading.Thread(target=lambda: launched.append(launch_spotify()), daemon=True)
+        launcher.start()
+        
+        device = self._poll_for_device(lambda: bool(launched) and not launched[0])
+        device_id = device['id'] if device else None
+        
+        if not device_id and launched and not launched[0]:
             if self.notifier:
                 self.notifier.send_notification(
                     "❌ Spotify Launch Failed",
                     "Could not launch Spotify desktop app. Please start it manually.",
-                    "dialog-error"
+                    *self._ICON_ERR
                 )
             return None
         
-        import time
-        # Poll for device readiness (up to 3 seconds, check every 0.3s)
-        device_id = None
-        for _ in range(10):
-            device_id = self._find_active_device()
-            if device_id:
-                break
-            time.sleep(0.3)
-        
         if device_id:
+            if device.get('is_active'):
+                return device_id  # Already the active device, no transfer needed
             try:
-                self.spotify.transfer_playback(device_id, force_play=True)
+                self._spotify_call(self.spotify.transfer_playback, device_id, force_play=True)
+                self._invalidate_playback_cache()
+                self._devices_cache = (0.0, None)
                 time.sleep(0.5)  # Wait for transfer
                 return device_id
             except Exception as e:
@@ -438,7 +883,7 @@ class SpotifyController:
                     self.notifier.send_notification(
                         "❌ Transfer Error",
                         "Failed to transfer playback to device.",
-                        "dialog-error"
+                        *self._ICON_ERR
                     )
                 return None
         else:
@@ -446,7 +891,7 @@ class SpotifyController:
                 self.notifier.send_notification(
                     "❌ Device Not Found",
                     "Could not find a Spotify device to transfer playback.",
-                    "dialog-error"
+                    *self._ICON_ERR
                 )
             return None
     
@@ -467,7 +912,7 @@ class SpotifyController:
                 self.notifier.send_notification(
                     "❌ Setup Failed",
                     f"Failed to set up device for {action_name}.",
-                    "dialog-error"
+                    *self._ICON_ERR
                 )
         return device_id
     
@@ -480,6 +925,28 @@ class SpotifyController:
         except Exception as e:
             if self.error_handler:
                 self.error_handler.handle_error(e, "Failed to cleanup Spotify cache")
-    
-    # All Spotify control methods will be moved here from EnhancedVoiceAssistant
-    # e.g. play_song, resume_playback, pause_playback, next_track, previous_track, adjust_volume, get_current_track
+        finally:
+            self._stop_refresh.set()
+            self._session.close()
+            # A cleaned-up controller has a closed session; let
+            # get_spotify_controller() build a fresh one next time
+            with _CONTROLLER_LOCK:
+                for key, controller in list(_CONTROLLER_SINGLETON.items()):
+                    if controller is self:
+                        del _CONTROLLER_SINGLETON[key]
+
+
+# Controllers shared per (client_id, redirect_uri, cache_path)
+_CONTROLLER_SINGLETON = {}
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def get_spotify_controller(client_id, client_secret, redirect_uri, cache_path, notifier=None):
+    """Return the process-wide SpotifyController for these credentials, creating it on first use."""
+    key = (client_id, redirect_uri, cache_path)
+    with _CONTROLLER_LOCK:
+        controller = _CONTROLLER_SINGLETON.get(key)
+        if controller is None:
+            controller = SpotifyController(client_id, client_secret, redirect_uri, cache_path, notifier)
+            _CONTROLLER_SINGLETON[key] = controller
+        return controller
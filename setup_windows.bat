@@ -63,7 +63,7 @@ if /i "%pydeps%"=="n" (
     pip install -r requirements.txt
     if errorlevel 1 (
         echo ⚠️  requirements.txt failed, trying individual packages...
-        pip install spotipy SpeechRecognition pyttsx3 python-dotenv colorama psutil
+        pip install spotipy SpeechRecognition pyttsx3 python-dotenv psutil
         
         REM Try to install PyAudio (might need special handling on Windows)
         echo Attempting to install PyAudio...
@@ -80,7 +80,7 @@ if (-not $SkipDependencies) {
         }
         
         # Install core packages individually
-        $packages = @("spotipy", "SpeechRecognition", "pyttsx3", "python-dotenv", "colorama", "psutil")
+        $packages = @("spotipy", "SpeechRecognition", "pyttsx3", "python-dotenv", "psutil")
         foreach ($package in $packages) {
             Write-Host "Installing $package..." -ForegroundColor Blue
             pip install $package